@@ -4,22 +4,96 @@ import asyncio
 import sys
 import json
 import time
-from typing import Dict, Any, List, Optional, AsyncIterator
-from contextlib import asynccontextmanager
+import re
+import itertools
+import hashlib
+from typing import Annotated, Dict, Any, List, Optional, AsyncIterator, Awaitable, Callable, Tuple
+from contextlib import asynccontextmanager, AsyncExitStack
 
-import boto3
+import aioboto3
+from cachetools import TTLCache
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 from mcp.server.fastmcp import FastMCP, Context
 from pydantic import BaseModel, Field
 
-# Set up logging
+# Set up logging (defaults to INFO; DEBUG is expensive under SSE traffic).
+# Only names understood by both logging and uvicorn are accepted, mapped to uvicorn's names
+LOG_LEVELS = {
+    "CRITICAL": "critical",
+    "FATAL": "critical",
+    "ERROR": "error",
+    "WARNING": "warning",
+    "WARN": "warning",
+    "INFO": "info",
+    "DEBUG": "debug",
+}
+requested_log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVEL = requested_log_level if requested_log_level in LOG_LEVELS else "INFO"
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger("athena-mcp")
+if requested_log_level != LOG_LEVEL:
+    logger.warning(f"Unsupported LOG_LEVEL '{requested_log_level}', using INFO (allowed: {', '.join(LOG_LEVELS)})")
 logger.info("Starting AWS Athena MCP in SSE mode")
 
+# Query status polling backoff: start small so fast queries return quickly,
+# then grow geometrically to keep GetQueryExecution traffic low for long queries
+QUERY_POLL_MIN_DELAY_SECONDS = 0.05
+QUERY_POLL_MAX_DELAY_SECONDS = 5.0
+QUERY_POLL_BACKOFF_FACTOR = 1.5
+
+# States in which a query is still waited on; UNKNOWN covers responses missing a status
+QUERY_PENDING_STATES = ('RUNNING', 'QUEUED', 'UNKNOWN')
+
+# Above this many requested rows, results are read from the CSV Athena writes to S3
+# instead of paging through GetQueryResults (at most 1000 rows per API call)
+S3_RESULTS_THRESHOLD = 1000
+
+# One field of an Athena result CSV plus its separator. Athena quotes every non-NULL
+# value (doubling embedded quotes) and writes NULL as an unquoted empty field, which
+# the stdlib csv module can't tell apart from an empty string
+CSV_FIELD_PATTERN = re.compile(r'(?:"([^"]*(?:""[^"]*)*)"|([^",\r\n]*))(,|\r?\n|$)')
+
+# Only read-only statements are coalesced; identical concurrent writes (INSERT, CTAS,
+# UNLOAD, DDL) must each run. Leading comments, whitespace and parentheses are skipped.
+READ_ONLY_QUERY_PATTERN = re.compile(
+    r'^(?:\s+|--[^\n]*(?:\n|$)|/\*.*?\*/|\()*(?:SELECT|WITH|SHOW|DESCRIBE)\b',
+    re.IGNORECASE | re.DOTALL
+)
+
+# The result CSV is downloaded as concurrent byte-range reads; the number of ranges
+# per round doubles up to the limit, so at most about twice the needed bytes are read
+S3_RANGE_SIZE_BYTES = 1024 * 1024
+S3_MAX_CONCURRENT_RANGES = 16
+
+# Upper bounds for execute_query arguments, shared by QueryRequest and the tool signature
+MAX_RESULTS_LIMIT = 100000
+MAX_WAIT_SECONDS_LIMIT = 3600  # 1 hour
+
+# Athena accepts result reuse ages of 1 minute to 7 days; the default age is used when
+# a request enables reuse explicitly but ATHENA_RESULT_REUSE_MINUTES disables it
+RESULT_REUSE_MAX_MINUTES = 10080
+RESULT_REUSE_DEFAULT_MINUTES = 60
+
+# Catalog metadata changes rarely, so database, table and schema lookups are
+# cached for a few minutes (cleared on demand by the refresh_metadata tool)
+METADATA_CACHE_SIZE = 1024
+METADATA_CACHE_TTL_SECONDS = 300
+
+# Shared botocore configuration: a pool large enough for concurrent tool calls,
+# keepalive to reuse TLS connections, and adaptive retries for throttling
+BOTO_CONFIG = AioConfig(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+# Called with (rows fetched so far, rows requested) while results are downloaded
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
 # Pydantic models for request/response
 class QueryRequest(BaseModel):
     query: str
@@ -27,8 +101,12 @@ class QueryRequest(BaseModel):
     catalog: Optional[str] = None
     output_location: Optional[str] = None
     workgroup: Optional[str] = None
-    max_results: Optional[int] = Field(default=100, ge=1, le=1000)
-    max_wait_seconds: Optional[int] = Field(default=300, ge=1, le=3600)  # Default 5 minutes, max 1 hour
+    max_results: Optional[int] = Field(default=100, ge=1, le=MAX_RESULTS_LIMIT)
+    max_wait_seconds: Optional[int] = Field(default=300, ge=1, le=MAX_WAIT_SECONDS_LIMIT)  # Default 5 minutes
+    result_reuse_enable: Optional[bool] = None  # Defaults to enabled unless ATHENA_RESULT_REUSE_MINUTES is 0
+    result_reuse_max_age_minutes: Optional[int] = Field(default=None, ge=1, le=RESULT_REUSE_MAX_MINUTES)
+    columnar: Optional[bool] = False  # Return rows_columnar instead of rows
+    include_statistics: Optional[bool] = False
 
 class QueryResults(BaseModel):
     query_execution_id: str
@@ -37,6 +115,7 @@ class QueryResults(BaseModel):
     statistics: Optional[Dict[str, Any]] = None
     columns: Optional[List[Dict[str, str]]] = None
     rows: Optional[List[Dict[str, Any]]] = None
+    rows_columnar: Optional[Dict[str, List[Any]]] = None
     error_message: Optional[str] = None
     
 class AthenaClient:
@@ -44,71 +123,326 @@ class AthenaClient:
         self.region_name = region_name or os.environ.get('AWS_REGION', 'us-east-1')
         logger.info(f"Initializing Athena client in region: {self.region_name}")
         
-        # Initialize Athena client
-        self.client = boto3.client('athena', region_name=self.region_name)
+        # The async Athena and S3 clients are opened once via __aenter__ and reused for every request
+        self.session = aioboto3.Session()
+        self.client = None
+        self.s3_client = None
+        self._exit_stack = AsyncExitStack()
+        
+        # Metadata caches keyed on (catalog, database, table) prefixes
+        self._databases_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL_SECONDS)
+        self._tables_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL_SECONDS)
+        self._table_metadata_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL_SECONDS)
+        
+        # Running executions keyed by request hash, shared by identical concurrent requests
+        self._inflight: Dict[str, asyncio.Task] = {}
         
         # Get default values from environment
         self.default_catalog = os.environ.get('ATHENA_CATALOG', 'AwsDataCatalog')
         self.default_database = os.environ.get('ATHENA_DATABASE')
         self.default_workgroup = os.environ.get('ATHENA_WORKGROUP', 'primary')
         self.default_output_location = os.environ.get('ATHENA_OUTPUT_LOCATION')
+        # A zero or negative delay would never grow and poll GetQueryExecution back to back
+        self.poll_delay_seconds = max(float(os.environ.get('ATHENA_POLL_DELAY_SECONDS', '0.2')), QUERY_POLL_MIN_DELAY_SECONDS)
+        self.result_reuse_minutes = int(os.environ.get('ATHENA_RESULT_REUSE_MINUTES', str(RESULT_REUSE_DEFAULT_MINUTES)))
+        if not 0 <= self.result_reuse_minutes <= RESULT_REUSE_MAX_MINUTES:
+            clamped = min(max(self.result_reuse_minutes, 0), RESULT_REUSE_MAX_MINUTES)
+            logger.warning(f"ATHENA_RESULT_REUSE_MINUTES={self.result_reuse_minutes} is outside 0-{RESULT_REUSE_MAX_MINUTES}, using {clamped}")
+            self.result_reuse_minutes = clamped
+        
+        # Precompute the StartQueryExecution parameters implied by the defaults
+        self._base_execute_params = {'WorkGroup': self.default_workgroup}
+        query_execution_context = {}
+        if self.default_catalog:
+            query_execution_context['Catalog'] = self.default_catalog
+        if self.default_database:
+            query_execution_context['Database'] = self.default_database
+        if query_execution_context:
+            self._base_execute_params['QueryExecutionContext'] = query_execution_context
+        if self.default_output_location:
+            self._base_execute_params['ResultConfiguration'] = {
+                'OutputLocation': self.default_output_location
+            }
+        if reuse_configuration := self.build_result_reuse_configuration(self.result_reuse_minutes):
+            self._base_execute_params['ResultReuseConfiguration'] = reuse_configuration
         
         logger.info(f"Default catalog: {self.default_catalog}")
         logger.info(f"Default database: {self.default_database or 'Not set'}")
         logger.info(f"Default workgroup: {self.default_workgroup}")
         logger.info(f"Default output location: {self.default_output_location or 'Not set'}")
+        logger.info(f"Initial poll delay: {self.poll_delay_seconds}s")
+        logger.info(f"Result reuse max age: {f'{self.result_reuse_minutes} minutes' if self.result_reuse_minutes else 'Disabled'}")
     
-    async def execute_query(self, request: QueryRequest) -> QueryResults:
-        """Execute an Athena query and wait for results"""
-        try:
-            # Prepare query execution parameters
-            execute_params = {
-                'QueryString': request.query,
-                'WorkGroup': request.workgroup or self.default_workgroup
+    @staticmethod
+    def build_result_reuse_configuration(max_age_minutes: int) -> Optional[Dict[str, Any]]:
+        """Build the ResultReuseConfiguration that lets Athena return cached results of an identical recent query"""
+        if not max_age_minutes:
+            return None
+        return {
+            'ResultReuseByAgeConfiguration': {
+                'Enabled': True,
+                'MaxAgeInMinutes': max_age_minutes
             }
+        }
+    
+    async def __aenter__(self) -> "AthenaClient":
+        self.client = await self._exit_stack.enter_async_context(
+            self.session.client('athena', region_name=self.region_name, config=BOTO_CONFIG)
+        )
+        self.s3_client = await self._exit_stack.enter_async_context(
+            self.session.client('s3', region_name=self.region_name, config=BOTO_CONFIG)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._exit_stack.aclose()
+        self.client = None
+        self.s3_client = None
+    
+    async def wait_for_query(self, query_execution_id: str, max_wait: int) -> Dict[str, Any]:
+        """Wait for a query to reach a terminal state (or max_wait to elapse) and return its execution details"""
+        delay = self.poll_delay_seconds
+        start_time = time.monotonic()
+        
+        while True:
+            # Check before sleeping so already-finished (e.g. reused) queries return immediately
+            query_details = await self.client.get_query_execution(QueryExecutionId=query_execution_id)
+            execution = query_details.get('QueryExecution') or {}
+            if (execution.get('Status') or {}).get('State', 'UNKNOWN') not in QUERY_PENDING_STATES:
+                return execution
             
-            # Add optional parameters if provided
-            query_execution_context = {}
-            if catalog := (request.catalog or self.default_catalog):
-                query_execution_context['Catalog'] = catalog
-            if database := (request.database or self.default_database):
-                query_execution_context['Database'] = database
+            remaining = max_wait - (time.monotonic() - start_time)
+            if remaining <= 0:
+                return execution
             
-            if query_execution_context:
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * QUERY_POLL_BACKOFF_FACTOR, QUERY_POLL_MAX_DELAY_SECONDS)
+    
+    @staticmethod
+    def decode_results(column_info: List[Dict[str, Any]], data_rows: List[List[Optional[str]]],
+                       columnar: bool = False) -> Tuple[List[Dict[str, str]], Optional[List[Dict[str, Any]]], Optional[Dict[str, List[Any]]]]:
+        """Build the columns and either row-major or columnar data from raw result rows"""
+        # Extract column info
+        columns = []
+        for col in column_info:
+            columns.append({
+                'name': col.get('Name', ''),
+                'type': col.get('Type', '')
+            })
+        
+        names = [col['name'] for col in columns]
+        if columnar:
+            # One list per column avoids repeating every column name in every row
+            rows_columnar = {
+                name: [values[i] if i < len(values) else None for values in data_rows]
+                for i, name in enumerate(names)
+            }
+            return columns, None, rows_columnar
+        
+        # Extract data rows, padding rows with missing trailing cells with None
+        rows = [dict(zip(names, itertools.chain(values, itertools.repeat(None)))) for values in data_rows]
+        return columns, rows, None
+    
+    @staticmethod
+    def parse_csv_records(data: bytes, limit: int, partial: bool = False) -> List[List[Optional[str]]]:
+        """Parse up to limit records from an Athena result CSV, returning None for NULL fields
+        
+        With partial=True the data may end mid-record; parsing then stops at the first
+        incomplete field instead of raising.
+        """
+        text = data.decode('utf-8', errors='replace' if partial else 'strict')
+        records = []
+        record = []
+        position = 0
+        while position < len(text) and len(records) < limit:
+            match = CSV_FIELD_PATTERN.match(text, position)
+            if match is None:
+                if partial:
+                    break
+                raise ValueError(f"Malformed result CSV at offset {position}")
+            quoted, bare, separator = match.groups()
+            if quoted is not None:
+                record.append(quoted.replace('""', '"'))
+            else:
+                record.append(bare or None)
+            position = match.end()
+            if separator != ',':
+                records.append(record)
+                record = []
+                if not separator:
+                    break
+        return records
+    
+    async def fetch_query_results(self, query_execution_id: str, max_results: int,
+                                  progress: Optional[ProgressCallback] = None) -> Tuple[List[Dict[str, Any]], List[List[Optional[str]]]]:
+        """Page through GetQueryResults and return the column info and up to max_results data rows"""
+        paginator = self.client.get_paginator('get_query_results')
+        pages = paginator.paginate(
+            QueryExecutionId=query_execution_id,
+            PaginationConfig={
+                # The first page starts with a header row, so fetch one extra item
+                'MaxItems': max_results + 1,
+                'PageSize': min(1000, max_results + 1)
+            }
+        )
+        
+        column_info = None
+        result_rows = []
+        async for page in pages:
+            # Column info is the same on every page, so take it from the first
+            if column_info is None:
+                column_info = ((page.get('ResultSet') or {}).get('ResultSetMetadata') or {}).get('ColumnInfo')
+            result_rows.extend((page.get('ResultSet') or {}).get('Rows', []))
+            if progress:
+                await progress(max(len(result_rows) - 1, 0), max_results)
+        
+        # Skip header row if present
+        data_rows = [
+            [cell.get('VarCharValue') for cell in row.get('Data', [])]
+            for row in result_rows[1:]
+        ]
+        return column_info or [], data_rows
+    
+    async def read_s3_range(self, bucket: str, key: str, start: int, end: int) -> bytes:
+        """Read an inclusive byte range of an S3 object"""
+        response = await self.s3_client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}")
+        async with response['Body'] as body:
+            return await body.read()
+    
+    async def read_csv_results(self, query_execution_id: str, output_location: str, max_results: int,
+                               progress: Optional[ProgressCallback] = None) -> Tuple[List[Dict[str, Any]], List[List[Optional[str]]]]:
+        """Read up to max_results data rows from the result CSV Athena wrote to S3"""
+        bucket, _, key = output_location[len('s3://'):].partition('/')
+        
+        # Column types are not in the CSV, so fetch them with a single one-row API call
+        # while looking up the object size
+        metadata_response, head_response = await asyncio.gather(
+            self.client.get_query_results(QueryExecutionId=query_execution_id, MaxResults=1),
+            self.s3_client.head_object(Bucket=bucket, Key=key)
+        )
+        column_info = ((metadata_response.get('ResultSet') or {}).get('ResultSetMetadata') or {}).get('ColumnInfo', [])
+        size = head_response.get('ContentLength', 0)
+        
+        # Fetch rounds of concurrent range reads and stop once the header, max_results rows
+        # and the start of the next record are buffered. Ranges are joined in order before
+        # parsing, so they don't need to be aligned to record boundaries.
+        needed_records = max_results + 1
+        buffer = bytearray()
+        newlines = 0
+        records = []
+        offset = 0
+        range_count = 1
+        while offset < size:
+            round_end = min(offset + range_count * S3_RANGE_SIZE_BYTES, size)
+            chunks = await asyncio.gather(*[
+                self.read_s3_range(bucket, key, start, min(start + S3_RANGE_SIZE_BYTES, round_end) - 1)
+                for start in range(offset, round_end, S3_RANGE_SIZE_BYTES)
+            ])
+            for chunk in chunks:
+                buffer += chunk
+                newlines += chunk.count(b'\n')
+            offset = round_end
+            if progress:
+                # Lines approximate rows here; quoted values may contain newlines
+                await progress(min(max(newlines - 1, 0), max_results), max_results)
+            range_count = min(range_count * 2, S3_MAX_CONCURRENT_RANGES)
+            
+            # Quoted values may contain newlines, so the line count is only a lower bound check
+            if offset < size and newlines > needed_records:
+                # A trailing partial record or character only affects the record after the last one we keep
+                records = await asyncio.to_thread(self.parse_csv_records, buffer, needed_records + 1, True)
+                if len(records) > needed_records:
+                    break
+        else:
+            records = await asyncio.to_thread(self.parse_csv_records, buffer, needed_records)
+        
+        # Skip header row
+        return column_info, records[1:needed_records]
+    
+    async def execute_query(self, request: QueryRequest, progress: Optional[ProgressCallback] = None) -> QueryResults:
+        """Execute an Athena query and wait for results, coalescing identical concurrent read-only requests"""
+        if not READ_ONLY_QUERY_PATTERN.match(request.query):
+            return await self.run_query(request, progress)
+        
+        key = hashlib.sha1(json.dumps(request.model_dump(), sort_keys=True).encode()).hexdigest()
+        
+        task = self._inflight.get(key)
+        if task is None:
+            logger.debug("Starting new execution for request %s", key)
+            
+            async def report_progress(fetched: int, total: int) -> None:
+                # The execution may outlive the caller's session, so never let progress fail it
+                try:
+                    await progress(fetched, total)
+                except Exception as e:
+                    logger.debug("Failed to report progress for request %s: %s", key, e)
+            
+            task = asyncio.create_task(self.run_query(request, report_progress if progress else None))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Joining in-flight execution for request %s", key)
+        
+        # Shield so one caller being cancelled doesn't cancel the query for the others
+        return await asyncio.shield(task)
+    
+    async def run_query(self, request: QueryRequest, progress: Optional[ProgressCallback] = None) -> QueryResults:
+        """Execute an Athena query and wait for results"""
+        try:
+            # Start from the parameters precomputed from the defaults and only
+            # override what this request actually sets
+            execute_params = {**self._base_execute_params, 'QueryString': request.query}
+            if request.workgroup:
+                execute_params['WorkGroup'] = request.workgroup
+            
+            if request.catalog or request.database:
+                query_execution_context = dict(execute_params.get('QueryExecutionContext', {}))
+                if request.catalog:
+                    query_execution_context['Catalog'] = request.catalog
+                if request.database:
+                    query_execution_context['Database'] = request.database
                 execute_params['QueryExecutionContext'] = query_execution_context
             
-            # Set result configuration if output location provided
-            if output_location := (request.output_location or self.default_output_location):
+            if request.output_location:
                 execute_params['ResultConfiguration'] = {
-                    'OutputLocation': output_location
+                    'OutputLocation': request.output_location
                 }
             
+            # Let Athena return cached results of an identical recent query instead of re-scanning
+            if request.result_reuse_enable is not None or request.result_reuse_max_age_minutes:
+                reuse_enabled = request.result_reuse_enable if request.result_reuse_enable is not None else bool(self.result_reuse_minutes)
+                reuse_minutes = 0
+                if reuse_enabled:
+                    reuse_minutes = (request.result_reuse_max_age_minutes or self.result_reuse_minutes
+                                     or RESULT_REUSE_DEFAULT_MINUTES)
+                reuse_configuration = self.build_result_reuse_configuration(reuse_minutes)
+                if reuse_configuration:
+                    execute_params['ResultReuseConfiguration'] = reuse_configuration
+                else:
+                    execute_params.pop('ResultReuseConfiguration', None)
+            
             # Start query execution
-            logger.info(f"Starting query execution: {request.query[:100]}...")
-            response = self.client.start_query_execution(**execute_params)
-            query_execution_id = response['QueryExecutionId']
-            logger.info(f"Query execution ID: {query_execution_id}")
+            logger.info("Starting query execution: %.100s...", request.query)
+            response = await self.client.start_query_execution(**execute_params)
+            query_execution_id = response.get('QueryExecutionId')
+            if not query_execution_id:
+                http_status = (response.get('ResponseMetadata') or {}).get('HTTPStatusCode')
+                return QueryResults(
+                    query_execution_id="",
+                    status="ERROR",
+                    error_message=f"Athena did not return a query execution ID (HTTP {http_status})"
+                )
+            logger.info("Query execution ID: %s", query_execution_id)
             
             # Wait for query to complete (with timeout)
             max_wait = request.max_wait_seconds or 300  # Default 5 minutes
-            start_time = time.time()
-            status = 'RUNNING'
-            state_change_reason = None
-            
-            while status in ('RUNNING', 'QUEUED') and (time.time() - start_time) < max_wait:
-                await asyncio.sleep(1)  # Check every second
-                
-                query_details = self.client.get_query_execution(QueryExecutionId=query_execution_id)
-                execution = query_details['QueryExecution']
-                status = execution['Status']['State']
-                state_change_reason = execution['Status'].get('StateChangeReason')
-                
-                # If status is no longer running/queued, break the loop
-                if status not in ('RUNNING', 'QUEUED'):
-                    break
+            execution = await self.wait_for_query(query_execution_id, max_wait)
+            execution_status = execution.get('Status') or {}
+            status = execution_status.get('State', 'UNKNOWN')
+            state_change_reason = execution_status.get('StateChangeReason')
             
             # If query still running after timeout, return with status
-            if status in ('RUNNING', 'QUEUED') and (time.time() - start_time) >= max_wait:
+            if status in QUERY_PENDING_STATES:
                 return QueryResults(
                     query_execution_id=query_execution_id,
                     status="TIMEOUT",
@@ -117,57 +451,45 @@ class AthenaClient:
             
             # Get statistics if available
             statistics = None
-            if 'Statistics' in execution:
+            if request.include_statistics and (execution_statistics := execution.get('Statistics')):
                 statistics = {
-                    'processing_time_ms': execution['Statistics'].get('TotalExecutionTimeInMillis'),
-                    'data_scanned_bytes': execution['Statistics'].get('DataScannedInBytes'),
-                    'engine_execution_time_ms': execution['Statistics'].get('EngineExecutionTimeInMillis'),
-                    'query_queue_time_ms': execution['Statistics'].get('QueryQueueTimeInMillis'),
-                    'service_processing_time_ms': execution['Statistics'].get('ServiceProcessingTimeInMillis')
+                    'processing_time_ms': execution_statistics.get('TotalExecutionTimeInMillis'),
+                    'data_scanned_bytes': execution_statistics.get('DataScannedInBytes'),
+                    'engine_execution_time_ms': execution_statistics.get('EngineExecutionTimeInMillis'),
+                    'query_queue_time_ms': execution_statistics.get('QueryQueueTimeInMillis'),
+                    'service_processing_time_ms': execution_statistics.get('ServiceProcessingTimeInMillis')
                 }
             
             # If query succeeded, get results
             if status == 'SUCCEEDED':
-                # Get results with pagination if needed
                 max_results = request.max_results or 100
-                results_response = self.client.get_query_results(
-                    QueryExecutionId=query_execution_id,
-                    MaxResults=max_results
-                )
-                
-                # Extract column info
-                columns = []
-                column_info = results_response['ResultSet']['ResultSetMetadata']['ColumnInfo']
-                for col in column_info:
-                    columns.append({
-                        'name': col['Name'],
-                        'type': col['Type']
-                    })
-                
-                # Extract data rows
-                rows = []
-                result_rows = results_response['ResultSet'].get('Rows', [])
+                output_location = (execution.get('ResultConfiguration') or {}).get('OutputLocation') or ''
                 
-                # Skip header row if present
-                data_rows = result_rows[1:] if result_rows and len(result_rows) > 0 else []
+                # Large result sets are much faster to read from S3 than through GetQueryResults;
+                # only SELECT-style queries write a CSV there
+                if max_results > S3_RESULTS_THRESHOLD and output_location.endswith('.csv'):
+                    try:
+                        column_info, data_rows = await self.read_csv_results(query_execution_id, output_location, max_results, progress)
+                    except Exception as e:
+                        # Any S3 failure (API, transport, decoding or a malformed CSV) must not turn a
+                        # succeeded query into an error, so read the results through the API instead
+                        logger.warning("Could not read results from %s, falling back to GetQueryResults: %s", output_location, e)
+                        column_info, data_rows = await self.fetch_query_results(query_execution_id, max_results, progress)
+                else:
+                    column_info, data_rows = await self.fetch_query_results(query_execution_id, max_results, progress)
                 
-                for row in data_rows:
-                    row_data = {}
-                    for i, col in enumerate(columns):
-                        # Handle potential missing data
-                        if i < len(row['Data']):
-                            cell = row['Data'][i]
-                            row_data[col['name']] = cell.get('VarCharValue') if 'VarCharValue' in cell else None
-                        else:
-                            row_data[col['name']] = None
-                    rows.append(row_data)
+                # Decoding is pure Python, so run it off the event loop to keep other sessions responsive
+                columns, rows, rows_columnar = await asyncio.to_thread(
+                    self.decode_results, column_info, data_rows, request.columnar
+                )
                 
                 return QueryResults(
                     query_execution_id=query_execution_id,
                     status=status,
                     statistics=statistics,
                     columns=columns,
-                    rows=rows
+                    rows=rows,
+                    rows_columnar=rows_columnar
                 )
             else:
                 # Handle failed queries
@@ -181,14 +503,16 @@ class AthenaClient:
                 )
                 
         except ClientError as e:
-            logger.error(f"Boto3 client error: {str(e)}")
+            logger.error("Boto3 client error: %s", e)
+            # Include the HTTP status so callers can tell retriable 5xx errors from fatal 4xx ones
+            http_status = (e.response.get('ResponseMetadata') or {}).get('HTTPStatusCode')
             return QueryResults(
                 query_execution_id="",
                 status="ERROR",
-                error_message=f"AWS Client Error: {str(e)}"
+                error_message=f"AWS Client Error (HTTP {http_status}): {str(e)}"
             )
         except Exception as e:
-            logger.error(f"Error executing query: {str(e)}", exc_info=True)
+            logger.error("Error executing query: %s", e, exc_info=True)
             return QueryResults(
                 query_execution_id="",
                 status="ERROR",
@@ -199,42 +523,58 @@ class AthenaClient:
         """List available databases in the given catalog"""
         try:
             catalog_name = catalog or self.default_catalog
-            logger.info(f"Listing databases in catalog: {catalog_name}")
+            key = (catalog_name,)
+            if key in self._databases_cache:
+                return self._databases_cache[key]
+            logger.info("Listing databases in catalog: %s", catalog_name)
             
-            response = self.client.list_databases(
+            response = await self.client.list_databases(
                 CatalogName=catalog_name
             )
             
             databases = [db['Name'] for db in response.get('DatabaseList', [])]
+            self._databases_cache[key] = databases
             return databases
         except Exception as e:
-            logger.error(f"Error listing databases: {str(e)}", exc_info=True)
+            logger.error("Error listing databases: %s", e, exc_info=True)
             return []
     
     async def list_tables(self, database: str, catalog: Optional[str] = None) -> List[str]:
         """List tables in the given database"""
         try:
             catalog_name = catalog or self.default_catalog
-            logger.info(f"Listing tables in catalog: {catalog_name}, database: {database}")
+            key = (catalog_name, database)
+            if key in self._tables_cache:
+                return self._tables_cache[key]
+            logger.info("Listing tables in catalog: %s, database: %s", catalog_name, database)
             
-            response = self.client.list_table_metadata(
+            # ListTableMetadata returns at most 50 tables per call, so page through all of
+            # them; get_schema relies on this cache entry being the complete table list
+            paginator = self.client.get_paginator('list_table_metadata')
+            pages = paginator.paginate(
                 CatalogName=catalog_name,
                 DatabaseName=database
             )
             
-            tables = [table['Name'] for table in response.get('TableMetadataList', [])]
+            tables = []
+            async for page in pages:
+                tables.extend(table['Name'] for table in page.get('TableMetadataList', []))
+            self._tables_cache[key] = tables
             return tables
         except Exception as e:
-            logger.error(f"Error listing tables: {str(e)}", exc_info=True)
+            logger.error("Error listing tables: %s", e, exc_info=True)
             return []
     
     async def get_table_metadata(self, table: str, database: str, catalog: Optional[str] = None) -> Dict[str, Any]:
         """Get metadata for a specific table"""
         try:
             catalog_name = catalog or self.default_catalog
-            logger.info(f"Getting metadata for table: {table} in database: {database}")
+            key = (catalog_name, database, table)
+            if key in self._table_metadata_cache:
+                return self._table_metadata_cache[key]
+            logger.info("Getting metadata for table: %s in database: %s", table, database)
             
-            response = self.client.get_table_metadata(
+            response = await self.client.get_table_metadata(
                 CatalogName=catalog_name,
                 DatabaseName=database,
                 TableName=table
@@ -254,10 +594,11 @@ class AthenaClient:
                     'name': col.get('Name'),
                     'type': col.get('Type')
                 })
-                
+            
+            self._table_metadata_cache[key] = result
             return result
         except Exception as e:
-            logger.error(f"Error getting table metadata: {str(e)}", exc_info=True)
+            logger.error("Error getting table metadata: %s", e, exc_info=True)
             return {
                 'name': table,
                 'database': database,
@@ -265,6 +606,59 @@ class AthenaClient:
                 'columns': [],
                 'error': str(e)
             }
+    
+    async def get_schema(self, database: str, catalog: Optional[str] = None) -> Dict[str, Any]:
+        """Get column definitions for every table in the given database"""
+        try:
+            catalog_name = catalog or self.default_catalog
+            
+            # Serve from the metadata caches when every table is already known
+            tables = self._tables_cache.get((catalog_name, database))
+            if tables is not None:
+                cached = [self._table_metadata_cache.get((catalog_name, database, table)) for table in tables]
+                if all(metadata is not None for metadata in cached):
+                    return {'database': database, 'catalog': catalog_name, 'tables': cached}
+            
+            logger.info("Getting schema for catalog: %s, database: %s", catalog_name, database)
+            
+            # ListTableMetadata returns the columns of many tables per call
+            paginator = self.client.get_paginator('list_table_metadata')
+            pages = paginator.paginate(
+                CatalogName=catalog_name,
+                DatabaseName=database
+            )
+            
+            schema = []
+            async for page in pages:
+                for table_metadata in page.get('TableMetadataList', []):
+                    result = {
+                        'name': table_metadata['Name'],
+                        'database': database,
+                        'catalog': catalog_name,
+                        'columns': [
+                            {'name': col.get('Name'), 'type': col.get('Type')}
+                            for col in table_metadata.get('Columns', [])
+                        ]
+                    }
+                    self._table_metadata_cache[(catalog_name, database, result['name'])] = result
+                    schema.append(result)
+            
+            self._tables_cache[(catalog_name, database)] = [table['name'] for table in schema]
+            return {'database': database, 'catalog': catalog_name, 'tables': schema}
+        except Exception as e:
+            logger.error("Error getting schema: %s", e, exc_info=True)
+            return {
+                'database': database,
+                'catalog': catalog_name,
+                'tables': [],
+                'error': str(e)
+            }
+    
+    def clear_metadata_cache(self) -> None:
+        """Drop all cached database, table and table metadata lookups"""
+        self._databases_cache.clear()
+        self._tables_cache.clear()
+        self._table_metadata_cache.clear()
 
 # Global client instance
 athena_client = None
@@ -273,18 +667,26 @@ athena_client = None
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
     global athena_client
-    logger.info("Initializing Athena client")
     
-    # Get AWS region from environment variable
-    region = os.getenv("AWS_REGION", "us-east-1")
-    
-    # Initialize Athena client
-    athena_client = AthenaClient(region_name=region)
+    # The lifespan is entered by both the Starlette app and every MCP session,
+    # so only create the client once and share it for the process lifetime
+    owns_client = athena_client is None
+    if owns_client:
+        logger.info("Initializing Athena client")
+        
+        # Get AWS region from environment variable
+        region = os.getenv("AWS_REGION", "us-east-1")
+        
+        # Initialize Athena client
+        athena_client = await AthenaClient(region_name=region).__aenter__()
     
     try:
         yield
     finally:
-        logger.info("Cleaning up resources")
+        if owns_client:
+            logger.info("Cleaning up resources")
+            await athena_client.__aexit__(None, None, None)
+            athena_client = None
 
 # Create MCP server
 mcp = FastMCP("AWS Athena MCP", lifespan=app_lifespan)
@@ -293,8 +695,13 @@ mcp = FastMCP("AWS Athena MCP", lifespan=app_lifespan)
 @mcp.tool()
 async def execute_query(ctx: Context, query: str, database: Optional[str] = None, 
                       catalog: Optional[str] = None, output_location: Optional[str] = None,
-                      workgroup: Optional[str] = None, max_results: Optional[int] = 100,
-                      max_wait_seconds: Optional[int] = 300) -> QueryResults:
+                      workgroup: Optional[str] = None,
+                      max_results: Annotated[Optional[int], Field(ge=1, le=MAX_RESULTS_LIMIT)] = 100,
+                      max_wait_seconds: Annotated[Optional[int], Field(ge=1, le=MAX_WAIT_SECONDS_LIMIT)] = 300,
+                      result_reuse_enable: Optional[bool] = None,
+                      result_reuse_max_age_minutes: Annotated[Optional[int], Field(ge=1, le=RESULT_REUSE_MAX_MINUTES)] = None,
+                      columnar: Optional[bool] = False,
+                      include_statistics: Optional[bool] = False) -> QueryResults:
     """Execute an Athena SQL query and return results
     
     Args:
@@ -303,25 +710,37 @@ async def execute_query(ctx: Context, query: str, database: Optional[str] = None
         catalog: Optional catalog name (defaults to environment variable or AwsDataCatalog)
         output_location: Optional S3 location for query results (defaults to environment variable)
         workgroup: Optional workgroup name (defaults to environment variable or primary)
-        max_results: Maximum number of results to return (default: 100)
+        max_results: Maximum number of results to return (default: 100, max: 100000)
         max_wait_seconds: Maximum time to wait for query completion in seconds (default: 300)
+        result_reuse_enable: Optional flag to reuse results of an identical recent query (defaults to enabled)
+        result_reuse_max_age_minutes: Optional maximum age of reused results in minutes (defaults to environment variable or 60)
+        columnar: Return results as rows_columnar, a mapping of column name to values, instead of rows (default: False)
+        include_statistics: Include execution time and data scanned statistics in the results (default: False)
         
     Returns:
         Query results including columns and data rows
     """
-    logger.info(f"Tool called: execute_query(query={query[:50]}..., database={database})")
+    logger.info("Tool called: execute_query(query=%.50s..., database=%s)", query, database)
     
-    request = QueryRequest(
+    # Arguments were already validated against the tool schema (including the
+    # bounds above), so build the request without validating them again
+    request = QueryRequest.model_construct(
         query=query,
         database=database,
         catalog=catalog,
         output_location=output_location,
         workgroup=workgroup,
-        max_results=max_results,
-        max_wait_seconds=max_wait_seconds
+        max_results=max_results or 100,
+        max_wait_seconds=max_wait_seconds or 300,
+        result_reuse_enable=result_reuse_enable,
+        result_reuse_max_age_minutes=result_reuse_max_age_minutes,
+        columnar=columnar,
+        include_statistics=include_statistics
     )
     
-    result = await athena_client.execute_query(request)
+    # Report download progress to clients that request it; the rows themselves are
+    # returned in the single tool result since MCP tool calls have one response
+    result = await athena_client.execute_query(request, progress=ctx.report_progress)
     return result
 
 @mcp.tool()
@@ -334,7 +753,7 @@ async def list_databases(ctx: Context, catalog: Optional[str] = None) -> List[st
     Returns:
         List of database names
     """
-    logger.info(f"Tool called: list_databases(catalog={catalog})")
+    logger.info("Tool called: list_databases(catalog=%s)", catalog)
     return await athena_client.list_databases(catalog)
 
 @mcp.tool()
@@ -348,7 +767,7 @@ async def list_tables(ctx: Context, database: str, catalog: Optional[str] = None
     Returns:
         List of table names
     """
-    logger.info(f"Tool called: list_tables(database={database}, catalog={catalog})")
+    logger.info("Tool called: list_tables(database=%s, catalog=%s)", database, catalog)
     return await athena_client.list_tables(database, catalog)
 
 @mcp.tool()
@@ -363,9 +782,38 @@ async def get_table_metadata(ctx: Context, table: str, database: str, catalog: O
     Returns:
         Table metadata including column definitions
     """
-    logger.info(f"Tool called: get_table_metadata(table={table}, database={database}, catalog={catalog})")
+    logger.info("Tool called: get_table_metadata(table=%s, database=%s, catalog=%s)", table, database, catalog)
     return await athena_client.get_table_metadata(table, database, catalog)
 
+@mcp.tool()
+async def get_schema(ctx: Context, database: str, catalog: Optional[str] = None) -> Dict[str, Any]:
+    """Get column definitions for all tables in a database in a single call
+    
+    Prefer this over calling get_table_metadata for each table when exploring a database.
+    
+    Args:
+        database: Database name
+        catalog: Optional catalog name (defaults to environment variable or AwsDataCatalog)
+        
+    Returns:
+        Database schema with the column definitions of every table
+    """
+    logger.info("Tool called: get_schema(database=%s, catalog=%s)", database, catalog)
+    return await athena_client.get_schema(database, catalog)
+
+@mcp.tool()
+async def refresh_metadata(ctx: Context) -> Dict[str, str]:
+    """Clear cached database, table and schema metadata so the next lookups query Athena again
+    
+    Use this after tables or databases have been created, dropped or altered.
+    
+    Returns:
+        Confirmation status
+    """
+    logger.info("Tool called: refresh_metadata()")
+    athena_client.clear_metadata_cache()
+    return {"status": "ok"}
+
 # Enhanced health check
 async def health_check():
     if not athena_client:
@@ -406,6 +854,8 @@ if __name__ == "__main__":
         logger.info(f"ATHENA_CATALOG: {os.getenv('ATHENA_CATALOG', 'Not set - using default AwsDataCatalog')}")
         logger.info(f"ATHENA_DATABASE: {os.getenv('ATHENA_DATABASE', 'Not set')}")
         logger.info(f"ATHENA_WORKGROUP: {os.getenv('ATHENA_WORKGROUP', 'Not set - using default primary')}")
+        logger.info(f"ATHENA_RESULT_REUSE_MINUTES: {os.getenv('ATHENA_RESULT_REUSE_MINUTES', 'Not set - using default 60')}")
+        logger.info(f"ATHENA_POLL_DELAY_SECONDS: {os.getenv('ATHENA_POLL_DELAY_SECONDS', 'Not set - using default 0.2')}")
         
         # Check if output location is set and valid
         output_location = os.getenv('ATHENA_OUTPUT_LOCATION')
@@ -414,12 +864,18 @@ if __name__ == "__main__":
         elif not output_location.startswith('s3://'):
             logger.warning(f"ATHENA_OUTPUT_LOCATION '{output_location}' doesn't use s3:// protocol")
         
+        import orjson
         import uvicorn
         from starlette.applications import Starlette
         from starlette.routing import Mount
         from starlette.responses import JSONResponse
         from starlette.middleware.cors import CORSMiddleware
         
+        class ORJSONResponse(JSONResponse):
+            """JSON response rendered with orjson instead of the stdlib encoder"""
+            def render(self, content: Any) -> bytes:
+                return orjson.dumps(content)
+        
         # Create Starlette app with SSE
         sse_app = mcp.sse_app()
         
@@ -437,12 +893,12 @@ if __name__ == "__main__":
         async def health(request):
             result = await health_check()
             status_code = 200 if result.get("status") == "ok" else 500
-            return JSONResponse(result, status_code=status_code)
+            return ORJSONResponse(result, status_code=status_code)
         
         # Add a root endpoint for basic connectivity testing
         @sse_app.route("/")
         async def root(request):
-            return JSONResponse({
+            return ORJSONResponse({
                 "status": "MCP server running",
                 "name": "AWS Athena MCP",
                 "endpoints": ["/health", "/sse"]
@@ -459,7 +915,9 @@ if __name__ == "__main__":
         port = int(os.getenv("PORT", 8050))
         logger.info(f"Starting server on {host}:{port}")
         
-        config = uvicorn.Config(app, host=host, port=port, log_level="debug")
+        # uvicorn's default "auto" loop/http settings pick uvloop and httptools when
+        # installed (via uvicorn[standard]) and fall back to asyncio/h11 otherwise
+        config = uvicorn.Config(app, host=host, port=port, log_level=LOG_LEVELS[LOG_LEVEL])
         server = uvicorn.Server(config)
         server.run()  # Synchronous run to avoid event loop issues in containers
         